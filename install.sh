@@ -7,6 +7,8 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 # Fan Controller specific paths
 FC_BIN_TARGET="/usr/local/bin/pwmfan_controller.py"
 FC_SERVICE_TARGET="/etc/systemd/system/pwmfan-controller.service"
+FC_ONESHOT_SERVICE_TARGET="/etc/systemd/system/pwmfan-controller-oneshot.service"
+FC_ONESHOT_TIMER_TARGET="/etc/systemd/system/pwmfan-controller-oneshot.timer"
 FC_CONFIG_TARGET="/etc/pwmfan_config.json"
 
 # PWM Setup specific paths
@@ -28,6 +30,10 @@ sudo install -m 755 "${SCRIPT_DIR}/src/pwmfan_controller.py" "${FC_BIN_TARGET}"
 echo "[4/6] Installing fan controller systemd service..."
 sudo install -m 644 "${SCRIPT_DIR}/etc/systemd/pwmfan-controller.service" "${FC_SERVICE_TARGET}"
 
+echo "[+] Installing oneshot fan controller service and timer (alternative mode, not enabled)..."
+sudo install -m 644 "${SCRIPT_DIR}/etc/systemd/pwmfan-controller-oneshot.service" "${FC_ONESHOT_SERVICE_TARGET}"
+sudo install -m 644 "${SCRIPT_DIR}/etc/systemd/pwmfan-controller-oneshot.timer" "${FC_ONESHOT_TIMER_TARGET}"
+
 echo "[5/6] Installing fan controller configuration file..."
 if [ ! -f "${FC_CONFIG_TARGET}" ]; then
     sudo install -m 644 "${SCRIPT_DIR}/etc/pwmfan_config.json" "${FC_CONFIG_TARGET}"
@@ -68,7 +74,10 @@ echo "[7/7] Enabling and starting services..."
 sudo systemctl daemon-reload
 # Enable both services. pwm-setup is oneshot, so --now isn't needed here.
 sudo systemctl enable pwmfan-setup.service
-# Enable and restart the main fan controller service
+# Enable and restart the main fan controller service.
+# Note: pwmfan-controller-oneshot.timer is installed but left disabled; to use
+# timer-driven oneshot mode instead, disable pwmfan-controller.service and
+# enable the timer - do not enable both.
 sudo systemctl enable --now pwmfan-controller.service
 # Explicitly run pwm-setup once after install/update in case it needs to run before first restart
 echo "Running initial PWM setup..."
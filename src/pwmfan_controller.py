@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
-import argparse
+import array
+import bisect
+import concurrent.futures
+import ctypes
+import ctypes.util
+import errno
+import fcntl
+import functools
 import gettext
 import json
 import locale
 import logging
+import operator
 import os
+import select
 import signal
+import struct
 import sys  # Import sys for exit
 import time
+import types
 
 # Version Information
 __version__ = "1.0.8"
@@ -33,6 +44,41 @@ except (locale.Error, FileNotFoundError, TypeError):
 
 _ = lang.gettext  # Assign the translation function
 
+# Optional JSON accelerator: orjson parses bytes directly and is several
+# times faster than the stdlib scanner. Purely opportunistic — the stdlib
+# parser remains the default and nothing in the tree requires orjson.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Pre-translated hot-path log templates. Resolving gettext once at import time
+# and passing %-style arguments lets the logging framework skip all formatting
+# (and catalog lookups) when the record's level is disabled.
+_MSG_TEMP_DUTY = _("Temperature: %.1f°C => Calculated duty cycle: %s%%")
+_MSG_DUTY_CHANGE = _("Temperature %.1f°C triggers change: Updating duty cycle from %s%% to %s%%.")
+_MSG_LOOP_START = _("Auto mode loop iteration started.")
+_MSG_TEMP_READ_FAILED = _("Temperature read failed (%s/%s consecutive errors).")
+_MSG_NO_TEMP_FOR_DUTY = _("Cannot determine duty cycle because temperature reading failed.")
+_MSG_SIGNAL_EXIT = _("Received signal %s (%s), terminating program.")
+
+# Accepted log_level names. logging.getLevelName's reverse lookup never
+# raises on a miss (it returns the string "Level <name>"), so validating
+# against this dict is both faster and actually catches bad config values.
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Log record formats, hoisted so main() only picks between them
+_LOG_FORMAT_VERBOSE = "[%(levelname)s %(filename)s:%(lineno)d] %(message)s"
+_LOG_FORMAT_NORMAL = "[%(levelname)s] %(message)s"
+
 # Configuration file path
 CONFIG_FILE = "/etc/pwmfan_config.json"
 RASPBERRY_PI_MODEL_PATH = "/sys/firmware/devicetree/base/model"
@@ -43,6 +89,9 @@ DEFAULT_CONFIG = {
     "pwm_path": "/sys/class/pwm/pwmchip0/pwm0",
     "temp_sensor_paths": ["/sys/class/thermal/thermal_zone0/temp"],
     "interval": 10,
+    "sample_interval": 10,
+    "hysteresis_c": 1.0,
+    "low_priority": True,
     "verbose": True,
     "log_level": "WARNING",
     "temperature_to_duty": [
@@ -54,9 +103,319 @@ DEFAULT_CONFIG = {
     ],
 }
 
+# --- Optional inotify support for config-change detection ---
+# Polling the config file's mtime costs a stat() every iteration for an event
+# that happens rarely; an inotify watch makes the steady-state check free.
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    HAS_INOTIFY = hasattr(_libc, "inotify_init1") and hasattr(_libc, "inotify_add_watch")
+except OSError:
+    _libc = None
+    HAS_INOTIFY = False
+
+
+class ConfigWatcher:
+    """Watches the config file's directory via inotify for config changes.
+
+    The watch is placed on the directory rather than the file itself so that
+    atomic-rename edits (editor save, `mv tmpfile config`) are also caught.
+    Events are drained non-blockingly each tick; the fd is exposed so callers
+    can also select() on it.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    _EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+    def __init__(self, config_file):
+        if not HAS_INOTIFY:
+            raise OSError(_("inotify is not available on this platform"))
+        self.config_file = config_file
+        self._config_name = os.path.basename(config_file)
+        # Set when drain() consumed a config hit that config_changed() has
+        # not reported yet
+        self._pending = False
+        self.fd = _libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        watch_dir = os.path.dirname(config_file) or "."
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(watch_dir), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, os.strerror(err))
+        logging.debug("inotify watch established on %s for %s", watch_dir, self._config_name)
+
+    def config_changed(self):
+        """Drains pending events and returns True if any names the config file."""
+        changed = self._pending
+        self._pending = False
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break  # No more pending events
+            except OSError as e:
+                logging.warning(_("Error reading inotify events: {error}").format(error=e))
+                break
+            offset = 0
+            while offset + self._EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                name = data[offset : offset + name_len].split(b"\x00", 1)[0].decode(errors="replace")
+                offset += name_len
+                if name == self._config_name:
+                    changed = True
+        return changed
+
+    def drain(self):
+        """Consumes pending events immediately, deferring any config hit.
+
+        Used by mid-cycle waits: once the fd's events are read, select() on
+        it blocks again instead of returning instantly, while the hit is
+        still reported by the next config_changed() call.
+        """
+        if self.config_changed():
+            self._pending = True
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+# Set by the shutdown signal handler; polled by the auto-mode wait loop.
+_shutdown_signal = None
+
+
+def _request_shutdown(sig, frame):
+    """Minimal signal handler: records the signal and lets the wakeup fd
+    (see signal.set_wakeup_fd in auto_mode) interrupt the select() wait."""
+    global _shutdown_signal
+    _shutdown_signal = sig
+
+
+def _exit_on_signal(sig, frame):
+    """Handler for modes without a wakeup-fd loop (manual/oneshot).
+
+    The message template is translated once at import, so no gettext catalog
+    access happens inside the handler; the %-args defer formatting to the
+    logging framework.
+    """
+    logging.info(_MSG_SIGNAL_EXIT, signal.Signals(sig).name, sig)
+    sys.exit(0)
+
+
+# Cache of PWM period values keyed by pwm_path. The period is a configuration
+# value that only changes when userspace writes it, so re-reading it on every
+# config reload is wasted sysfs work; the cache is invalidated only when the
+# configured pwm_path itself changes.
+_period_cache = {}
+
+# Cache of the last observed enable state per pwm_path. Enablement only
+# changes out-of-band (pwmfan_setup.sh or a manual sysfs write), so duty
+# writes trust the cached True and re-validate only after a write failure.
+_pwm_enabled_cache = {}
+
+
+def _is_valid_curve_rule(rule):
+    """True if a curve rule is a {temp, duty} dict with numeric values and duty in 0-100."""
+    return (
+        isinstance(rule, dict)
+        and isinstance(rule.get("temp"), (int, float))
+        and isinstance(rule.get("duty"), (int, float))
+        and 0 <= rule["duty"] <= 100
+    )
+
+
+# Declarative config spec: key -> (predicate, human-readable requirement).
+# One spec-driven pass replaces the former chain of per-key isinstance blocks;
+# keys failing their predicate fall back to the (hardware-adjusted) default
+# individually, preserving the old per-key fallback behaviour. Cross-field
+# constraints (sample_interval vs interval) and filesystem advisories are
+# checked separately in load_config.
+_CONFIG_SPEC = {
+    "pwm_path": (lambda v: isinstance(v, str), "a string"),
+    "temp_sensor_paths": (lambda v: isinstance(v, list) and bool(v), "a non-empty list of strings"),
+    "interval": (lambda v: isinstance(v, int) and v > 0, "a positive integer"),
+    "hysteresis_c": (lambda v: isinstance(v, (int, float)) and v >= 0, "a non-negative number"),
+    "temperature_to_duty": (
+        lambda v: isinstance(v, list) and bool(v) and all(_is_valid_curve_rule(rule) for rule in v),
+        "a non-empty list of {temp, duty} rules with duty between 0 and 100",
+    ),
+}
+
 # --- Enhanced Helper Functions with Detailed Error Handling ---
 
 
+class SysfsFile:
+    """Persistent handle to a single sysfs attribute file.
+
+    Sysfs attributes are tiny pseudo-files that can be re-read from offset 0,
+    so keeping the descriptor open and using os.pread/os.pwrite avoids the
+    open()/close() syscall pair (and the Python file-object allocation) on
+    every polling tick.
+    """
+
+    READ_SIZE = 32  # Sysfs attribute values are small (one line)
+
+    def __init__(self, path, writable=False, dir_fd=None, name=None):
+        """path is the full attribute path (used for error messages). When
+        dir_fd and name are given, opens resolve name relative to dir_fd
+        (openat), skipping the full pathwalk; the caller owns dir_fd and must
+        keep it open for the life of this handle (reopens use it too)."""
+        self.path = path
+        # os.open encodes str paths on every call; pre-encode once since the
+        # path is immutable for the life of the handle.
+        self._path_bytes = os.fsencode(name) if name is not None else os.fsencode(path)
+        self._dir_fd = dir_fd
+        self.writable = writable
+        self.fd = None
+        self._open()
+
+    def _open(self):
+        # O_NONBLOCK so a stalled pseudo-file cannot block the open/read path
+        flags = os.O_WRONLY if self.writable else os.O_RDONLY | os.O_NONBLOCK
+        try:
+            self.fd = os.open(self._path_bytes, flags, dir_fd=self._dir_fd)
+        except FileNotFoundError:
+            logging.error(_("Sysfs path not found: {path}").format(path=self.path))
+            raise
+        except PermissionError:
+            logging.error(_("Permission denied opening sysfs path: {path}").format(path=self.path))
+            raise
+        except OSError as e:
+            logging.error(_("OS error opening sysfs path {path}: {error}").format(path=self.path, error=e))
+            raise
+
+    def _reopen(self):
+        """Re-establishes the descriptor after the underlying device went away.
+
+        A hotplugged (or re-bound) PWM/thermal device invalidates open
+        descriptors with ENODEV even though the sysfs path exists again;
+        reopening picks up the replacement attribute file.
+        """
+        self.close()
+        self._open()
+
+    def read(self):
+        """Reads the raw attribute bytes from offset 0 without reopening the file.
+
+        The bytes are returned undecoded: int() parses ASCII digits with
+        surrounding whitespace directly from bytes, so the numeric callers
+        skip the decode+strip round-trip entirely.
+        """
+        try:
+            return self._read_once()
+        except OSError as e:
+            if e.errno == errno.ENODEV:
+                logging.warning(_("Device behind {path} went away; reopening handle.").format(path=self.path))
+                self._reopen()
+                return self._read_once()
+            logging.error(_("OS error reading sysfs path {path}: {error}").format(path=self.path, error=e))
+            raise
+
+    def _read_once(self):
+        # No select() here: sysfs attributes always report readable, so a
+        # select-based timeout is dead weight — the pread itself can still
+        # block in the driver's show() callback. O_NONBLOCK (see _open) is
+        # the only stall protection the sysfs interface actually honours.
+        return os.pread(self.fd, self.READ_SIZE, 0)
+
+    def write(self, value):
+        """Writes the given value at offset 0 without reopening the file.
+
+        Accepts pre-encoded bytes directly so callers with a precomputed
+        payload skip the str()+encode allocations.
+        """
+        payload = value if isinstance(value, bytes) else str(value).encode()
+        try:
+            os.pwrite(self.fd, payload, 0)
+            logging.debug("Successfully wrote '%s' to %s", value, self.path)
+        except OSError as e:
+            if e.errno == errno.ENODEV:
+                logging.warning(_("Device behind {path} went away; reopening handle.").format(path=self.path))
+                self._reopen()
+                os.pwrite(self.fd, payload, 0)
+                return
+            logging.error(_("OS error writing to sysfs path {path}: {error}").format(path=self.path, error=e))
+            raise
+
+    def close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
+class PwmChardev:
+    """Atomic PWM updates through the /dev/pwmchipN character device.
+
+    Recent kernels expose a character device alongside the sysfs PWM
+    interface whose SETWAVEFORM ioctl applies period and duty cycle in a
+    single glitch-free kernel transition, instead of one string-parsing
+    sysfs write per attribute. On kernels without the chardev (or with a
+    different ABI revision) callers keep using the sysfs path; any ioctl
+    failure permanently falls back to sysfs for the rest of the run.
+    """
+
+    # period_ns, duty_ns, duty_offset_ns, channel — mirrors the UAPI
+    # pwm waveform layout (three u64 values plus the channel index).
+    _WAVEFORM = struct.Struct("QQQI")
+    # _IOW('p', 1, struct pwm_waveform): dir=write(1) << 30 | size << 16 | type << 8 | nr
+    _IOCTL_SETWAVEFORM = (1 << 30) | (_WAVEFORM.size << 16) | (ord("p") << 8) | 1
+
+    def __init__(self, chardev_path, channel):
+        self.path = chardev_path
+        self.channel = channel
+        self.fd = os.open(chardev_path, os.O_RDWR)
+
+    @classmethod
+    def probe(cls, pwm_path):
+        """Returns a PwmChardev for the chip backing pwm_path, or None if unavailable."""
+        pwm_path = pwm_path.rstrip("/")
+        chip_name = os.path.basename(os.path.dirname(pwm_path))
+        channel_name = os.path.basename(pwm_path)
+        if not chip_name.startswith("pwmchip") or not channel_name.startswith("pwm"):
+            logging.debug("Path %s does not look like a pwmchip channel; using sysfs writes.", pwm_path)
+            return None
+        try:
+            channel = int(channel_name[3:])
+        except ValueError:
+            return None
+        chardev_path = os.path.join("/dev", chip_name)
+        try:
+            chardev = cls(chardev_path, channel)
+        except FileNotFoundError:
+            # Expected on kernels without the PWM chardev interface
+            logging.debug("PWM chardev %s not present; using sysfs writes.", chardev_path)
+            return None
+        except OSError as e:
+            logging.warning(
+                _("Could not open PWM chardev {path}: {error}. Using sysfs writes.").format(path=chardev_path, error=e)
+            )
+            return None
+        logging.debug("Using PWM chardev %s (channel %s) for duty updates.", chardev_path, channel)
+        return chardev
+
+    def set_waveform(self, period_ns, duty_ns):
+        """Applies period and duty cycle atomically via the SETWAVEFORM ioctl."""
+        fcntl.ioctl(self.fd, self._IOCTL_SETWAVEFORM, self._WAVEFORM.pack(period_ns, duty_ns, 0, self.channel))
+
+    def close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+
 def read_sysfs_value(path):
     """Reads a value from a sysfs path with detailed error handling."""
     try:
@@ -83,7 +442,7 @@ def write_sysfs_value(path, value):
     try:
         with open(path, "w") as f:
             f.write(str(value))
-            logging.debug(f"Successfully wrote '{value}' to {path}")
+            logging.debug("Successfully wrote '%s' to %s", value, path)
     except FileNotFoundError:
         logging.error(_("Sysfs path not found: {path}").format(path=path))
         raise
@@ -100,31 +459,15 @@ def write_sysfs_value(path, value):
         raise
 
 
-# Read PWM period
-def read_period(pwm_path):
-    period_path = os.path.join(pwm_path, "period")
-    try:
-        value = read_sysfs_value(period_path)
-        period = int(value)
-        if period <= 0:
-            logging.error(_("Invalid PWM period value read from {path}: {value}").format(path=period_path, value=value))
-            raise ValueError(_("PWM period must be positive"))
-        logging.debug(f"Read PWM period: {period} from {period_path}")
-        return period
-    except ValueError as e:
-        logging.error(
-            _("Non-integer value read for PWM period from {path}. Value: '{value}'. Error: {error}").format(
-                path=period_path, value=value, error=e
-            )
-        )
-        raise
-    except Exception:  # Catch exceptions from read_sysfs_value or int()
-        # Error already logged by read_sysfs_value or above
-        raise  # Re-raise to indicate failure
+def _display_value(value):
+    """Renders a sysfs read result for log messages (decodes raw bytes)."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode(errors="replace").strip()
+    return value
 
 
 # Set duty cycle (percentage)
-def set_duty_cycle(percent, period, pwm_path):
+def set_duty_cycle(percent, period, pwm_path, duty_file=None, enable_file=None, chardev=None, duty_ns_bytes=None):
     duty_cycle_path = os.path.join(pwm_path, "duty_cycle")
     if not (0 <= percent <= 100):
         logging.warning(_("Duty cycle percent {percent}% out of range (0-100), clamping.").format(percent=percent))
@@ -134,7 +477,9 @@ def set_duty_cycle(percent, period, pwm_path):
         return  # Or raise an error, depending on desired behavior
 
     # --- Check if PWM is enabled before writing ---
-    if not check_pwm_enabled(pwm_path):
+    # The enable attribute is only re-read when the cache has no positive
+    # answer; a failed write below invalidates the cache and re-checks.
+    if not _pwm_enabled_cache.get(pwm_path) and not check_pwm_enabled(pwm_path, enable_file=enable_file):
         logging.warning(
             _("Attempted to set duty cycle while PWM is not enabled for {path}. Skipping write.").format(path=pwm_path)
         )
@@ -142,34 +487,92 @@ def set_duty_cycle(percent, period, pwm_path):
     # --- End check ---
 
     duty_ns = int(period * (percent / 100.0))
+    # Prefer the atomic chardev ioctl when a handle is available; any
+    # failure disables it for the rest of the run and drops to sysfs.
+    if chardev is not None and chardev.fd is not None:
+        try:
+            chardev.set_waveform(period, duty_ns)
+            logging.debug("Set duty cycle via PWM chardev: %s ns (channel %s)", duty_ns, chardev.channel)
+            return
+        except OSError as e:
+            logging.warning(_("PWM chardev write failed ({error}); falling back to sysfs writes.").format(error=e))
+            chardev.close()
     try:
-        write_sysfs_value(duty_cycle_path, duty_ns)
+        if duty_file is not None:
+            # Pre-encoded payloads from the curve table skip str()+encode
+            duty_file.write(duty_ns_bytes if duty_ns_bytes is not None else duty_ns)
+        else:
+            write_sysfs_value(duty_cycle_path, duty_ns)
     except Exception:
         # Error already logged by write_sysfs_value
-        # Decide if we need to re-raise or just log
+        # A failed write may mean the PWM was disabled out-of-band; drop the
+        # cached enable state and re-check so the log reflects reality.
+        _pwm_enabled_cache.pop(pwm_path, None)
+        check_pwm_enabled(pwm_path, enable_file=enable_file)
         logging.error(_("Failed to set duty cycle on {path}").format(path=duty_cycle_path))
         # Not re-raising here to potentially allow the loop to continue
 
 
+# Lazily created pool for concurrent multi-sensor reads. Sysfs reads release
+# the GIL during the syscall, so independent thermal zones can genuinely be
+# read in parallel; single-sensor configs never pay the pool overhead.
+_sensor_pool = None
+
+
+def _get_sensor_pool(sensor_count):
+    global _sensor_pool
+    if _sensor_pool is None:
+        _sensor_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, sensor_count), thread_name_prefix="tempread"
+        )
+    return _sensor_pool
+
+
 # Read CPU temperature (°C) - Now handles multiple paths and returns max temp
-def read_temperature(temp_sensor_paths):
-    """Reads temperatures from a list of sysfs paths and returns the maximum valid temperature."""
-    max_temp = -float("inf")  # Initialize with negative infinity
-    valid_temp_found = False
+def read_temperature(temp_sensor_paths, temp_files=None, top_threshold=None):
+    """Reads temperatures from a list of sysfs paths and returns the maximum
+    valid temperature in integer millidegrees Celsius (the sysfs unit).
+
+    top_threshold (also in millidegrees) marks the point where the duty curve
+    saturates: once any sensor reaches it the remaining sensors cannot change
+    the outcome, so the loop stops early. Sequential reads skip the remaining
+    syscalls entirely; pooled reads were already submitted, so only their
+    parsing is skipped.
+    """
+    max_temp = None
     read_errors = 0
 
-    for temp_sensor_path in temp_sensor_paths:
+    def read_one(temp_sensor_path):
+        """Returns (raw value, None) or (None, exception) for one sensor."""
         try:
-            value = read_sysfs_value(temp_sensor_path)  # Handles FileNotFoundError, PermissionError etc.
+            if temp_files is not None and temp_sensor_path in temp_files:
+                return temp_files[temp_sensor_path].read(), None
+            return read_sysfs_value(temp_sensor_path), None
+        except Exception as e:  # noqa: BLE001 - classified by the caller below
+            return None, e
+
+    if len(temp_sensor_paths) > 1:
+        # Blocking zone reads overlap in worker threads; results keep the
+        # configured path order so error reporting is unchanged.
+        outcomes = list(_get_sensor_pool(len(temp_sensor_paths)).map(read_one, temp_sensor_paths))
+    else:
+        # Lazy: with an early exit below, unvisited sensors are never read
+        outcomes = (read_one(path) for path in temp_sensor_paths)
+
+    for temp_sensor_path, (value, read_exc) in zip(temp_sensor_paths, outcomes):
+        try:
+            if read_exc is not None:
+                raise read_exc
             temp_milli = int(value)
-            temperature = temp_milli / 1000.0
-            logging.debug(f"Read temperature: {temperature}°C from {temp_sensor_path}")
-            max_temp = max(max_temp, temperature)
-            valid_temp_found = True
+            logging.debug("Read temperature: %s m°C from %s", temp_milli, temp_sensor_path)
+            max_temp = temp_milli if max_temp is None else max(max_temp, temp_milli)
+            if top_threshold is not None and max_temp >= top_threshold:
+                logging.debug("Temperature %s m°C saturates the curve; skipping remaining sensors.", max_temp)
+                break
         except ValueError as e:
             logging.error(
                 _("Non-integer value read for temperature from {path}: {value}. Error: {error}").format(
-                    path=temp_sensor_path, value=value, error=e
+                    path=temp_sensor_path, value=_display_value(value), error=e
                 )
             )
             read_errors += 1
@@ -186,13 +589,13 @@ def read_temperature(temp_sensor_paths):
             )
             read_errors += 1
 
-    if not valid_temp_found:
+    if max_temp is None:
         logging.error(
             _("Failed to read any valid temperature from configured paths: {paths}").format(paths=temp_sensor_paths)
         )
         return None  # Return None if no paths were readable
 
-    logging.debug(f"Maximum temperature from {temp_sensor_paths}: {max_temp}°C")
+    logging.debug("Maximum temperature from %s: %s m°C", temp_sensor_paths, max_temp)
     return max_temp
 
 
@@ -202,6 +605,12 @@ def load_config():
     # --- Hardware Detection ---
     detected_model = detect_raspberry_pi_model()
     adjusted_default_config = DEFAULT_CONFIG.copy()  # Start with base defaults
+    # A shallow dict copy still shares the mutable list values with
+    # DEFAULT_CONFIG, so a later in-place sort/filter would silently corrupt
+    # the module-level defaults for every subsequent reload. Copy the list
+    # fields per key; the scalar values are immutable and safe to share.
+    adjusted_default_config["temp_sensor_paths"] = list(DEFAULT_CONFIG["temp_sensor_paths"])
+    adjusted_default_config["temperature_to_duty"] = [dict(rule) for rule in DEFAULT_CONFIG["temperature_to_duty"]]
 
     if detected_model and "Raspberry Pi 5" in detected_model:
         logging.info(_("Detected Raspberry Pi 5. Adjusting default temperature sensors."))
@@ -228,14 +637,23 @@ def load_config():
     # --- Load User Configuration File ---
     # Start config with the (potentially hardware-adjusted) defaults
     config = adjusted_default_config
+    # Snapshot the adjusted defaults (lists included) before user settings are
+    # merged in: `config` aliases the same dict, so without a real copy every
+    # fallback in the validation pass below would just re-assign the user's
+    # own invalid value.
+    fallback_config = adjusted_default_config.copy()
+    fallback_config["temp_sensor_paths"] = list(adjusted_default_config["temp_sensor_paths"])
+    fallback_config["temperature_to_duty"] = [dict(rule) for rule in adjusted_default_config["temperature_to_duty"]]
     config_loaded_successfully = False
     user_config_data = {}
 
     try:
-        logging.debug(f"Attempting to load user configuration from: {CONFIG_FILE}")
-        with open(CONFIG_FILE, "r") as f:
-            user_config_data = json.load(f)
-            logging.debug(f"Raw data loaded from config file: {user_config_data}")
+        logging.debug("Attempting to load user configuration from: %s", CONFIG_FILE)
+        # Read as bytes: both parsers accept them, and orjson requires no
+        # intermediate str
+        with open(CONFIG_FILE, "rb") as f:
+            user_config_data = _json_loads(f.read())
+            logging.debug("Raw data loaded from config file: %s", user_config_data)
             config_loaded_successfully = True
             logging.info(
                 _("Successfully loaded user configuration file: {config_file}").format(config_file=CONFIG_FILE)
@@ -256,7 +674,7 @@ def load_config():
                 config_file=CONFIG_FILE
             )
         )
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # Covers json.JSONDecodeError and orjson.JSONDecodeError
         logging.error(
             _("Error decoding JSON user configuration file {config_file}: {error}. Using defaults.").format(
                 config_file=CONFIG_FILE, error=e
@@ -270,129 +688,130 @@ def load_config():
         )
 
     # --- Configuration Validation ---
-    logging.debug(f"Validating final configuration: {config}")
+    logging.debug("Validating final configuration: %s", config)
     is_config_valid = True
-    # Base default to compare against if user config had issues
-    fallback_config = adjusted_default_config
 
-    # Validate pwm_path
+    # Single spec-driven pass over the per-key requirements
+    for key, (predicate, requirement) in _CONFIG_SPEC.items():
+        value = config.get(key)
+        if not predicate(value):
+            logging.error(
+                _(
+                    "Config Error: '{key}' must be {requirement}, but got {value!r}. Falling back to default: {fallback}"
+                ).format(key=key, requirement=requirement, value=value, fallback=fallback_config[key])
+            )
+            config[key] = fallback_config[key]
+            is_config_valid = False
+
+    # Filesystem advisories for pwm_path (warnings only, no fallback)
     pwm_key = "pwm_path"
-    path_val = config.get(pwm_key)
-    if not isinstance(path_val, str):
-        logging.error(
-            _("Config Error: '{key}' must be a string, but got {type}. Falling back to default: {fallback}").format(
-                key=pwm_key, type=type(path_val).__name__, fallback=fallback_config[pwm_key]
+    path_val = config[pwm_key]
+    pwm_dir = os.path.dirname(path_val)
+    pwm_chip_dir = os.path.dirname(pwm_dir)  # Go one level higher for pwmchip path
+    if not os.path.isdir(pwm_chip_dir):
+        logging.warning(
+            _("Parent PWM chip directory for '{key}' does not exist: {path}. PWM might not be available.").format(
+                key=pwm_key, path=pwm_chip_dir
             )
         )
-        config[pwm_key] = fallback_config[pwm_key]
-        is_config_valid = False
-    else:
-        pwm_dir = os.path.dirname(path_val)
-        pwm_chip_dir = os.path.dirname(pwm_dir)  # Go one level higher for pwmchip path
-        if not os.path.isdir(pwm_chip_dir):
-            logging.warning(
-                _("Parent PWM chip directory for '{key}' does not exist: {path}. PWM might not be available.").format(
-                    key=pwm_key, path=pwm_chip_dir
-                )
-            )
-        elif not os.path.exists(path_val):
-            logging.warning(
-                _("Configured path for '{key}' does not exist: {path}. It might need to be exported.").format(
-                    key=pwm_key, path=path_val
-                )
-            )
-
-    # Validate temp_sensor_paths
-    temp_key = "temp_sensor_paths"
-    paths_val = config.get(temp_key)
-    if not isinstance(paths_val, list) or not paths_val:
-        logging.error(
-            _("Config Error: '{key}' must be a non-empty list of strings. Falling back to default: {fallback}").format(
-                key=temp_key, fallback=fallback_config[temp_key]
+    elif not os.path.exists(path_val):
+        logging.warning(
+            _("Configured path for '{key}' does not exist: {path}. It might need to be exported.").format(
+                key=pwm_key, path=path_val
             )
         )
-        config[temp_key] = fallback_config[temp_key]
-        is_config_valid = False
-    else:
-        valid_paths = []
-        for i, path in enumerate(paths_val):
-            if not isinstance(path, str):
-                logging.error(
-                    _(
-                        "Config Error: Item at index {index} in '{key}' is not a string: {value}. Skipping this path."
-                    ).format(index=i, key=temp_key, value=path)
-                )
-                # Don't mark config as invalid here, just skip the entry if others exist
-                continue  # Skip this invalid path entry
-            elif not os.path.exists(path):
-                logging.warning(_("Configured path in '{key}' does not exist: {path}").format(key=temp_key, path=path))
-            valid_paths.append(path)  # Add even non-existent paths, read_temperature will handle errors
 
-        if not valid_paths:
+    # Per-entry filtering of temp_sensor_paths (non-string entries are skipped
+    # individually rather than discarding the whole list)
+    temp_key = "temp_sensor_paths"
+    paths_val = config[temp_key]
+    valid_paths = []
+    for i, path in enumerate(paths_val):
+        if not isinstance(path, str):
             logging.error(
                 _(
-                    "Config Error: '{key}' contains no valid or existing paths after filtering. Falling back to default: {fallback}"
-                ).format(key=temp_key, fallback=fallback_config[temp_key])
+                    "Config Error: Item at index {index} in '{key}' is not a string: {value}. Skipping this path."
+                ).format(index=i, key=temp_key, value=path)
             )
-            config[temp_key] = fallback_config[temp_key]
-            is_config_valid = False
-        elif len(valid_paths) < len(paths_val):
-            # If some user-provided paths were skipped due to type error
-            if config_loaded_successfully and temp_key in user_config_data:
-                logging.warning(
-                    _("Some paths provided by user in '{key}' were invalid and skipped.").format(key=temp_key)
-                )
-            config[temp_key] = valid_paths  # Update config with only the valid string paths
+            # Don't mark config as invalid here, just skip the entry if others exist
+            continue  # Skip this invalid path entry
+        elif not os.path.exists(path):
+            logging.warning(_("Configured path in '{key}' does not exist: {path}").format(key=temp_key, path=path))
+        valid_paths.append(path)  # Add even non-existent paths, read_temperature will handle errors
 
-    # Validate interval
-    interval_key = "interval"
-    interval_val = config.get(interval_key)
-    if not isinstance(interval_val, int) or interval_val <= 0:
+    if not valid_paths:
+        logging.error(
+            _(
+                "Config Error: '{key}' contains no valid or existing paths after filtering. Falling back to default: {fallback}"
+            ).format(key=temp_key, fallback=fallback_config[temp_key])
+        )
+        config[temp_key] = fallback_config[temp_key]
+        is_config_valid = False
+    elif len(valid_paths) < len(paths_val):
+        # If some user-provided paths were skipped due to type error
+        if config_loaded_successfully and temp_key in user_config_data:
+            logging.warning(_("Some paths provided by user in '{key}' were invalid and skipped.").format(key=temp_key))
+        config[temp_key] = valid_paths  # Update config with only the valid string paths
+
+    # Validate sample_interval (depends on the validated interval, so it stays
+    # a cross-field check outside the spec)
+    sample_key = "sample_interval"
+    effective_interval = config["interval"]  # Validated above
+    if not (config_loaded_successfully and sample_key in user_config_data):
+        # Not set by the user: default to one sample per cycle, tracking the
+        # effective interval rather than the hard-coded default pair (which
+        # would spuriously fail the check below whenever only 'interval' is
+        # customized).
+        config[sample_key] = effective_interval
+    sample_val = config[sample_key]
+    if not isinstance(sample_val, int) or sample_val <= 0 or sample_val > effective_interval:
         logging.error(
             _(
-                "Config Error: '{key}' must be a positive integer, but got {value}. Falling back to default: {fallback}"
-            ).format(key=interval_key, value=interval_val, fallback=fallback_config[interval_key])
+                "Config Error: '{key}' must be a positive integer no larger than 'interval', but got {value}. Falling back to: {fallback}"
+            ).format(key=sample_key, value=sample_val, fallback=effective_interval)
         )
-        config[interval_key] = fallback_config[interval_key]
+        config[sample_key] = effective_interval
         is_config_valid = False
+    elif effective_interval % sample_val != 0:
+        logging.warning(
+            _(
+                "Config Warning: 'interval' ({interval}) is not a multiple of '{key}' ({value}); sampling cadence will be approximate."
+            ).format(interval=effective_interval, key=sample_key, value=sample_val)
+        )
 
-    # Validate temperature curve
+    # Reject duplicate temperature thresholds, which would make the breakpoint
+    # lookup ambiguous, then build the curve already sorted —
+    # operator.itemgetter is a C-level key function. The curve is guaranteed
+    # to be a list of valid rules here: the spec pass above replaced any
+    # malformed value with the default, so rule["temp"] access is safe.
     curve_key = "temperature_to_duty"
-    curve = config.get(curve_key)
-    if not isinstance(curve, list) or not curve:
+    curve = config[curve_key]
+    if len({rule["temp"] for rule in curve}) != len(curve):
         logging.error(
-            _("Config Error: '{key}' must be a non-empty list. Falling back to default curve.").format(key=curve_key)
+            _("Config Error: '{key}' contains duplicate temperature thresholds. Falling back to default curve.").format(
+                key=curve_key
+            )
         )
-        config[curve_key] = fallback_config[curve_key]
+        curve = fallback_config[curve_key]
         is_config_valid = False
-    else:
-        for i, rule in enumerate(curve):
-            if (
-                not isinstance(rule, dict)
-                or "temp" not in rule
-                or "duty" not in rule
-                or not isinstance(rule["temp"], (int, float))
-                or not isinstance(rule["duty"], (int, float))
-                or not (0 <= rule["duty"] <= 100)
-            ):
-                logging.error(
-                    _(
-                        "Config Error: Invalid rule at index {index} in '{key}': {rule}. Falling back to default curve."
-                    ).format(index=i, key=curve_key, rule=rule)
-                )
-                config[curve_key] = fallback_config[curve_key]
-                is_config_valid = False
-                break  # Stop checking curve rules
-        else:  # If loop completed without break
-            try:
-                config[curve_key].sort(key=lambda x: x["temp"])
-                logging.debug("Temperature curve sorted.")
-            except Exception as e:
-                logging.error(
-                    _("Error sorting temperature curve: {error}. Falling back to default curve.").format(error=e)
-                )
-                config[curve_key] = fallback_config[curve_key]
-                is_config_valid = False
+    # Sorting covers the fallback path too, so the typed arrays below are
+    # always built from an ordered curve.
+    config[curve_key] = sorted(curve, key=operator.itemgetter("temp"))
+    logging.debug("Temperature curve sorted.")
+
+    # --- Pre-decompose the validated curve into parallel typed arrays ---
+    # Thresholds are quantized to integer millidegrees to match the sysfs
+    # sensor unit, so the per-tick lookup is an integer bisect over one
+    # contiguous array with no dict access and no float division. Duties stay
+    # as floats to preserve fractional duty percentages from user configs.
+    final_curve = config[curve_key]
+    # round(), not int(): truncation shifts float thresholds by 1 m°C
+    # (45.7 * 1000 == 45699.999…)
+    config["_curve_temps"] = array.array("l", (round(rule["temp"] * 1000) for rule in final_curve))
+    config["_curve_duties"] = array.array("d", (rule["duty"] for rule in final_curve))
+    # The curve (and thus any memoized lookup result) may have changed
+    temp_to_duty._last_in = None
+    temp_to_duty._last_out = None
 
     # --- Final Logging ---
     if config_loaded_successfully and not is_config_valid:
@@ -410,55 +829,63 @@ def load_config():
     return config
 
 
-# Return duty cycle based on temperature
-def temp_to_duty(temp_celsius, curve):
-    if temp_celsius is None:  # Handle case where temperature reading failed
-        logging.warning(_("Cannot determine duty cycle because temperature reading failed."))
+# Return duty cycle based on temperature (in integer millidegrees Celsius)
+def temp_to_duty(temp_milli, config):
+    if temp_milli is None:  # Handle case where temperature reading failed
+        logging.warning(_MSG_NO_TEMP_FOR_DUTY)
         return None  # Indicate failure
 
-    if not curve:  # Should have been caught by validation, but double-check
+    # Steady-state sensors report the same millidegree value for many ticks
+    # in a row; remembering the last input/output skips the whole lookup
+    # then. load_config resets the memo whenever the curve is rebuilt.
+    if temp_milli == temp_to_duty._last_in:
+        return temp_to_duty._last_out
+
+    curve_temps = config.get("_curve_temps")
+    curve_duties = config.get("_curve_duties")
+    if not curve_temps or not curve_duties:  # Should have been built by load_config
         logging.error(_("Attempted to use empty temperature curve!"))
         return None
 
-    # Ensure curve is sorted (validation should handle sorting, but defensive check)
-    # curve.sort(key=lambda x: x["temp"]) # Already sorted in load_config
-
-    selected_duty = curve[-1]["duty"]  # Default to highest duty if temp > all thresholds
-    for rule in curve:
-        try:
-            if temp_celsius < rule["temp"]:
-                selected_duty = rule["duty"]
-                break
-        except KeyError:
-            logging.error(_("Malformed rule in curve (missing 'temp' or 'duty'): {rule}").format(rule=rule))
-            # Potentially return None or fallback, here we continue loop hoping for a valid rule
-        except TypeError:
-            logging.error(_("Non-numeric 'temp' or 'duty' in curve rule: {rule}").format(rule=rule))
+    # bisect_right preserves the previous strict `<` comparison: a temperature
+    # below the first threshold selects the first duty, one at or above the
+    # last threshold selects the last duty.
+    index = bisect.bisect_right(curve_temps, temp_milli)
+    selected_duty = curve_duties[min(index, len(curve_duties) - 1)]
 
     # Clamp duty cycle just in case validation missed something
     selected_duty = max(0, min(100, selected_duty))
-    logging.debug(f"Temp {temp_celsius}°C -> Duty {selected_duty}%")
+    logging.debug("Temp %s m°C -> Duty %s%%", temp_milli, selected_duty)
+    temp_to_duty._last_in = temp_milli
+    temp_to_duty._last_out = selected_duty
     return selected_duty
 
 
-def check_pwm_enabled(pwm_path):
+# Memoization slots for temp_to_duty (see comment inside the function)
+temp_to_duty._last_in = None
+temp_to_duty._last_out = None
+
+
+def check_pwm_enabled(pwm_path, enable_file=None):
     enable_path = os.path.join(pwm_path, "enable")
     try:
-        value = read_sysfs_value(enable_path)
+        value = enable_file.read() if enable_file is not None else read_sysfs_value(enable_path)
         enabled = int(value)
         if enabled != 1:
             logging.error(
                 _("PWM is not enabled (read {value} from {path}). Please ensure PWM is exported and enabled.").format(
-                    value=value, path=enable_path
+                    value=_display_value(value), path=enable_path
                 )
             )
+            _pwm_enabled_cache[pwm_path] = False
             return False
-        logging.debug(f"PWM confirmed enabled via {enable_path}")
+        logging.debug("PWM confirmed enabled via %s", enable_path)
+        _pwm_enabled_cache[pwm_path] = True
         return True
     except ValueError as e:
         logging.error(
             _("Non-integer value read for PWM enable status from {path}: {value}. Error: {error}").format(
-                path=enable_path, value=value, error=e
+                path=enable_path, value=_display_value(value), error=e
             )
         )
         return False
@@ -472,52 +899,208 @@ def check_pwm_enabled(pwm_path):
         return False
 
 
+def probe_pwm(pwm_path, enable_file=None, period_file=None):
+    """Validates the PWM device in one combined pass.
+
+    Reads the enable and period attributes together — via the persistent
+    handles when provided, otherwise through a single os.scandir() pass that
+    resolves the PWM directory once instead of a full path walk per
+    attribute. Returns the period in ns when the PWM is enabled and the
+    period is positive, otherwise None.
+    """
+    try:
+        if enable_file is not None and period_file is not None:
+            enable_raw = enable_file.read()
+            period_raw = period_file.read()
+        else:
+            attr_paths = {}
+            with os.scandir(pwm_path) as entries:
+                for entry in entries:
+                    if entry.name in ("enable", "period"):
+                        attr_paths[entry.name] = entry.path
+            if "enable" not in attr_paths or "period" not in attr_paths:
+                logging.error(_("PWM path {path} is missing its enable/period attributes.").format(path=pwm_path))
+                return None
+            enable_raw = read_sysfs_value(attr_paths["enable"])
+            period_raw = read_sysfs_value(attr_paths["period"])
+    except OSError as e:
+        logging.error(_("Failed to probe PWM device at {path}: {error}").format(path=pwm_path, error=e))
+        return None
+
+    try:
+        enabled = int(enable_raw)
+        period_value = int(period_raw)
+    except ValueError as e:
+        logging.error(_("Non-integer PWM attribute value at {path}. Error: {error}").format(path=pwm_path, error=e))
+        return None
+    if enabled != 1:
+        logging.error(
+            _("PWM is not enabled (read {value} from {path}). Please ensure PWM is exported and enabled.").format(
+                value=_display_value(enable_raw), path=os.path.join(pwm_path, "enable")
+            )
+        )
+        return None
+    if period_value <= 0:
+        logging.error(
+            _("Invalid PWM period value read from {path}: {value}").format(
+                path=os.path.join(pwm_path, "period"), value=_display_value(period_raw)
+            )
+        )
+        return None
+    _pwm_enabled_cache[pwm_path] = True
+    return period_value
+
+
 def auto_mode(initial_config):
     """Runs the fan controller in automatic mode based on temperature."""
     config = initial_config
     last_config_mtime = 0
+    tick_counter = 0  # Drives the throttled mtime fallback check below
     last_duty = -1
+    last_duty_ns = -1  # Last duty value actually written to sysfs, in ns
     period = -1  # Initialize period
+    duty_scale = 0.0  # period / 100.0, refreshed whenever period is (re)read
     consecutive_read_errors = 0
     max_consecutive_read_errors = 5  # Exit if too many errors occur
 
-    logging.info(_("Starting Auto Mode with configuration:"))
-    # Log key config values safely
-    for key in ["pwm_path", "temp_sensor_paths", "interval", "log_level"]:  # Updated keys
-        logging.info(f"  {key}: {config.get(key)}")
-    logging.info(f"  temperature_to_duty: {config.get('temperature_to_duty')}")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(_("Starting Auto Mode with configuration:"))
+        # Log key config values safely
+        for key in ["pwm_path", "temp_sensor_paths", "interval", "log_level"]:  # Updated keys
+            logging.info("  %s: %s", key, config.get(key))
+        logging.info("  temperature_to_duty: %s", config.get("temperature_to_duty"))
 
-    # --- Get initial config file modification time ---
-    try:
-        if os.path.exists(CONFIG_FILE):
-            last_config_mtime = os.path.getmtime(CONFIG_FILE)
-            logging.debug(f"Initial config file mtime: {last_config_mtime}")
-        else:
+    # --- Config change detection: inotify when available, mtime polling fallback ---
+    config_watcher = None
+    if HAS_INOTIFY:
+        try:
+            config_watcher = ConfigWatcher(CONFIG_FILE)
+        except OSError as e:
+            logging.warning(
+                _("Could not set up inotify watch for {config_file}: {error}. Falling back to mtime polling.").format(
+                    config_file=CONFIG_FILE, error=e
+                )
+            )
+
+    if config_watcher is None:
+        # --- Get initial config file modification time ---
+        # One stat() call; a missing file simply keeps the 0 sentinel, which
+        # triggers a reload if the file appears later.
+        try:
+            last_config_mtime = os.stat(CONFIG_FILE).st_mtime_ns
+            logging.debug("Initial config file mtime: %s ns", last_config_mtime)
+        except FileNotFoundError:
             logging.debug("Config file does not exist initially.")
-    except OSError as e:
-        logging.warning(
-            _("Could not get initial mtime for config file {config_file}: {error}").format(
-                config_file=CONFIG_FILE, error=e
+        except OSError as e:
+            logging.warning(
+                _("Could not get initial mtime for config file {config_file}: {error}").format(
+                    config_file=CONFIG_FILE, error=e
+                )
             )
-        )
-        # last_config_mtime remains 0, will trigger reload if file appears later
+            # last_config_mtime remains 0, will trigger reload if file appears later
+
+    # Persistent sysfs handles for the steady-state loop, rebuilt on config reload
+    sysfs_files = {}
+    # duty percent -> duty_cycle ns for each curve level; the curve has only a
+    # handful of levels, so precomputing at initialization removes the
+    # float multiply/divide from the steady-state write path. Rebuilt by
+    # initialize_pwm whenever the period or the curve may have changed.
+    duty_ns_table = {}
+    # Same curve levels pre-encoded as the ASCII payloads sysfs expects, so
+    # the steady-state write is a single pwrite of a cached bytes object
+    duty_bytes_table = {}
+
+    def close_sysfs_files():
+        for handle in sysfs_files.values():
+            if isinstance(handle, dict):  # Temperature sensors are keyed by path
+                for sub_handle in handle.values():
+                    sub_handle.close()
+            elif isinstance(handle, int):  # The shared PWM directory fd
+                try:
+                    os.close(handle)
+                except OSError:
+                    pass
+            else:
+                handle.close()
+        sysfs_files.clear()
+
+    def open_sysfs_files(current_config):
+        """(Re)opens persistent handles for the PWM attributes and temperature sensors."""
+        close_sysfs_files()
+        pwm_path = current_config["pwm_path"]
+        # One pathwalk for the PWM directory; the attribute opens below then
+        # resolve just the leaf name relative to this fd (openat) instead of
+        # re-walking the full path per attribute. The fd stays open for the
+        # handles' lifetime so ENODEV reopens can use it too.
+        pwm_dir_fd = None
+        try:
+            pwm_dir_fd = os.open(pwm_path, os.O_RDONLY | os.O_DIRECTORY)
+            sysfs_files["_pwm_dir"] = pwm_dir_fd
+        except OSError:
+            pwm_dir_fd = None  # Fall back to full-path opens below
+        try:
+            sysfs_files["enable"] = SysfsFile(os.path.join(pwm_path, "enable"), dir_fd=pwm_dir_fd, name="enable")
+            sysfs_files["period"] = SysfsFile(os.path.join(pwm_path, "period"), dir_fd=pwm_dir_fd, name="period")
+            sysfs_files["duty"] = SysfsFile(
+                os.path.join(pwm_path, "duty_cycle"), writable=True, dir_fd=pwm_dir_fd, name="duty_cycle"
+            )
+        except OSError:
+            # Error already logged by SysfsFile; fall back to per-call opens
+            close_sysfs_files()
+            return
+        temp_files = {}
+        for path in current_config["temp_sensor_paths"]:
+            try:
+                temp_files[path] = SysfsFile(path)
+            except OSError:
+                # Leave the path out; read_temperature falls back to per-call opens
+                logging.warning(_("Could not open persistent handle for {path}.").format(path=path))
+        sysfs_files["temp"] = temp_files
+        # Optional atomic-write backend; absent on kernels without the chardev
+        chardev = PwmChardev.probe(pwm_path)
+        if chardev is not None:
+            sysfs_files["chardev"] = chardev
 
     # --- Initial PWM Setup ---
-    def initialize_pwm(current_config):
+    def rebuild_duty_tables(current_config):
+        """Precomputes duty_cycle ns values for every curve duty level."""
+        nonlocal duty_scale
+        duty_scale = period / 100.0
+        duty_ns_table.clear()
+        duty_bytes_table.clear()
+        for duty_value in current_config["_curve_duties"]:
+            target_ns = int(period * (duty_value / 100.0))
+            duty_ns_table[duty_value] = target_ns
+            duty_bytes_table[duty_value] = str(target_ns).encode("ascii")
+        logging.debug("Precomputed duty_cycle table: %s", duty_ns_table)
+
+    def initialize_pwm(current_config, verify_enable=True):
         nonlocal period
         pwm_path = current_config["pwm_path"]
-        if not check_pwm_enabled(pwm_path):
-            logging.error(_("Initial PWM check failed. Auto mode cannot run."))
-            return False
-        try:
-            period = read_period(pwm_path)
-            logging.info(_("PWM initialized. Period: {period} ns").format(period=period))
+        open_sysfs_files(current_config)
+        cached_period = _period_cache.get(pwm_path)
+        if cached_period is not None:
+            # Period already known; the enable state only needs re-checking
+            # when the caller could not rule out a device change. Duty writes
+            # re-verify enable themselves, so a stale True is self-correcting.
+            if verify_enable and not check_pwm_enabled(pwm_path, enable_file=sysfs_files.get("enable")):
+                logging.error(_("Initial PWM check failed. Auto mode cannot run."))
+                return False
+            period = cached_period
+            logging.debug("Using cached PWM period: %s for %s", period, pwm_path)
+            rebuild_duty_tables(current_config)
             return True
-        except Exception:
-            logging.error(
-                _("Failed to read initial PWM period from {path}. Auto mode cannot run.").format(path=pwm_path)
-            )
+        probed_period = probe_pwm(
+            pwm_path, enable_file=sysfs_files.get("enable"), period_file=sysfs_files.get("period")
+        )
+        if probed_period is None:
+            logging.error(_("Initial PWM check failed. Auto mode cannot run."))
             return False
+        period = probed_period
+        _period_cache[pwm_path] = period
+        rebuild_duty_tables(current_config)
+        logging.info(_("PWM initialized. Period: {period} ns").format(period=period))
+        return True
 
     if not initialize_pwm(config):
         # Consider exiting or entering a safe state if PWM fails initially
@@ -525,38 +1108,128 @@ def auto_mode(initial_config):
         sys.exit(1)  # Exit if PWM cannot be set up
     # --- End Initial PWM Setup ---
 
+    # --- Scheduling priority ---
+    # The steady-state loop is I/O-bound and latency-tolerant, so run it at
+    # idle priority to reclaim CPU for the workload the fan is protecting.
+    # Initialization above ran at normal priority; users who want guaranteed
+    # reaction time can set "low_priority": false.
+    if config.get("low_priority", True) and hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            os.nice(19)
+            logging.debug("Scheduler set to SCHED_IDLE with nice 19.")
+        except OSError as e:
+            logging.warning(_("Could not lower scheduling priority: {error}").format(error=e))
+
+    # --- Unified wait setup ---
+    # A single select() covers the interval sleep, config-change events and
+    # shutdown signals: signal.set_wakeup_fd writes the signal number to a
+    # self-pipe, so signal delivery interrupts the wait immediately instead
+    # of being deferred until a time.sleep() completes.
+    wakeup_rd, wakeup_wr = os.pipe()
+    os.set_blocking(wakeup_rd, False)
+    os.set_blocking(wakeup_wr, False)
+    signal.set_wakeup_fd(wakeup_wr)
+
+    def shutdown_if_requested():
+        if _shutdown_signal is None:
+            return
+        logging.info(
+            _("Received signal {signal_name} ({signal_number}), terminating program.").format(
+                signal_name=signal.Signals(_shutdown_signal).name, signal_number=_shutdown_signal
+            )
+        )
+        close_sysfs_files()
+        if config_watcher is not None:
+            config_watcher.close()
+        sys.exit(0)
+
+    def wait_for_events(timeout):
+        """Blocks up to timeout seconds; woken early by signals or config events."""
+        wait_fds = [wakeup_rd]
+        if config_watcher is not None:
+            wait_fds.append(config_watcher.fd)
+        try:
+            ready, _w, _x = select.select(wait_fds, [], [], timeout)
+        except InterruptedError:
+            ready = [wakeup_rd]
+        if wakeup_rd in ready:
+            try:
+                os.read(wakeup_rd, 64)  # Drain the wakeup bytes
+            except (BlockingIOError, OSError):
+                pass
+            shutdown_if_requested()
+        if config_watcher is not None and config_watcher.fd in ready:
+            # Drain now, or every subsequent wait this cycle (peak-hold
+            # sampling sleeps, skip-path waits) returns immediately until the
+            # top-of-loop config_changed() runs; that call still sees the
+            # change via the watcher's pending flag.
+            config_watcher.drain()
+
+    # Hoisted per-tick lookups: the verbose flag only changes on config
+    # reload, and the root-logger reference is a process invariant.
+    root_logger = logging.getLogger()
+    verbose = bool(config.get("verbose"))
+    # Monotonic deadline for drift-free pacing (advanced at the bottom of
+    # the loop, reset when a reload may have changed the interval)
+    next_tick = time.monotonic()
+
     while True:
-        logging.debug(_("Auto mode loop iteration started."))  # Changed level to DEBUG
+        shutdown_if_requested()
+        logging.debug(_MSG_LOOP_START)  # Changed level to DEBUG
         interval = config.get("interval", 10)  # Get interval for this iteration
         pwm_path = config["pwm_path"]
         temp_sensor_paths = config["temp_sensor_paths"]  # Use list of paths
 
         try:
             # Check for configuration file updates
-            current_mtime = 0
-            if os.path.exists(CONFIG_FILE):
+            tick_counter += 1
+            if config_watcher is not None:
+                config_changed = config_watcher.config_changed()
+            elif tick_counter % 10 == 0:
+                # Config changes are rare; only stat the file every 10th tick.
+                # Up to 10*interval detection latency is acceptable for the
+                # no-inotify fallback and saves two syscalls on other ticks.
+                # Single stat(); st_mtime_ns compares as an exact integer
+                current_mtime = 0
                 try:
-                    current_mtime = os.path.getmtime(CONFIG_FILE)
+                    current_mtime = os.stat(CONFIG_FILE).st_mtime_ns
+                except FileNotFoundError:
+                    pass  # Treated as "no config"; reload fires if it reappears
                 except OSError as e:
                     logging.warning(
                         _("Could not get mtime for config file {config_file}: {error}").format(
                             config_file=CONFIG_FILE, error=e
                         )
                     )
+                config_changed = current_mtime != last_config_mtime
+                if config_changed:
+                    last_config_mtime = current_mtime
+            else:
+                config_changed = False
 
-            if current_mtime != last_config_mtime:
+            if config_changed:
                 logging.info(_("Configuration file change detected, reloading configuration."))
+                old_pwm_path = config["pwm_path"]
                 config = load_config()  # Reload and re-validate config
-                last_config_mtime = current_mtime
-                # Re-initialize PWM if config changed
+                pwm_path_changed = config["pwm_path"] != old_pwm_path
+                if pwm_path_changed:
+                    # Only drop the cached state when the PWM device actually changed
+                    _period_cache.pop(old_pwm_path, None)
+                    _pwm_enabled_cache.pop(old_pwm_path, None)
+                # Re-initialize PWM if config changed; skip the redundant
+                # enable read when the device itself is unchanged
                 logging.info(_("Re-initializing PWM due to config change."))
-                if not initialize_pwm(config):
+                if not initialize_pwm(config, verify_enable=pwm_path_changed):
                     logging.error(_("Failed to re-initialize PWM after config reload. Skipping cycle."))
-                    time.sleep(interval)
+                    wait_for_events(interval)
                     continue
                 else:
-                    # Reset last_duty as the curve might have changed
+                    # Reset last_duty as the curve (or period) might have changed
                     last_duty = -1
+                    last_duty_ns = -1
+                    verbose = bool(config.get("verbose"))
+                    next_tick = time.monotonic()  # Interval may have changed
                     logging.info(_("PWM re-initialized successfully."))
 
             # Ensure period is valid before proceeding (could be invalid after failed reload)
@@ -566,72 +1239,122 @@ def auto_mode(initial_config):
                 )
                 if not initialize_pwm(config):
                     logging.error(_("Failed to re-initialize PWM period. Skipping cycle."))
-                    time.sleep(interval)
+                    wait_for_events(interval)
                     continue
                 if period <= 0:  # Still invalid after re-init
                     logging.error(_("PWM period still invalid after re-initialization. Skipping cycle."))
-                    time.sleep(interval)
+                    wait_for_events(interval)
                     continue
 
             # --- Read Temperature and Set Duty Cycle ---
-            temp = read_temperature(temp_sensor_paths)  # Pass the list of paths
+            # Temperature is sampled every sample_interval seconds with
+            # peak-hold, so short thermal spikes within the interval are not
+            # missed, while the curve evaluation and any duty-cycle write
+            # still happen only once per interval.
+            sample_interval = config.get("sample_interval", interval)
+            samples = max(1, interval // sample_interval)
+            peak_temp = None
+            # Above the last curve threshold the duty is saturated at the top
+            # level, so further sensors can't change the outcome
+            top_threshold = config["_curve_temps"][-1]
+            for sample_index in range(samples):
+                sample = read_temperature(
+                    temp_sensor_paths, temp_files=sysfs_files.get("temp"), top_threshold=top_threshold
+                )
+                if sample is not None:
+                    peak_temp = sample if peak_temp is None else max(peak_temp, sample)
+                if sample_index < samples - 1:
+                    wait_for_events(sample_interval)
+            temp = peak_temp
 
             if temp is None:
                 # Failed to read temperature (error logged in read_temperature)
                 consecutive_read_errors += 1
-                logging.warning(
-                    _(
-                        "Temperature read failed ({consecutive_read_errors}/{max_consecutive_read_errors} consecutive errors)."
-                    ).format(
-                        consecutive_read_errors=consecutive_read_errors,
-                        max_consecutive_read_errors=max_consecutive_read_errors,
-                    )
-                )
+                logging.warning(_MSG_TEMP_READ_FAILED, consecutive_read_errors, max_consecutive_read_errors)
                 if consecutive_read_errors >= max_consecutive_read_errors:
                     logging.critical(_("Exceeded maximum consecutive temperature read errors. Exiting."))
                     sys.exit(1)
                 # Optionally set a safe duty cycle here, e.g., 100%
                 # set_duty_cycle(100, period, pwm_path)
-                time.sleep(interval)
+                wait_for_events(interval)
                 continue  # Skip this iteration
             else:
                 consecutive_read_errors = 0  # Reset error count on success
 
-            duty = temp_to_duty(temp, config["temperature_to_duty"])
+            duty = temp_to_duty(temp, config)
 
             if duty is None:
                 logging.error(_("Failed to calculate duty cycle. Skipping update."))
                 # Keep last duty cycle?
-                time.sleep(interval)
+                wait_for_events(interval)
                 continue
 
+            # --- Hysteresis: avoid fan "hunting" around curve breakpoints ---
+            # Only step the duty down once the temperature has dropped clearly
+            # (hysteresis_c degrees) below the breakpoint; rising temperatures
+            # still take effect immediately.
+            hysteresis_milli = int(config.get("hysteresis_c", 0) * 1000)
+            if hysteresis_milli > 0 and last_duty >= 0 and duty < last_duty:
+                if temp_to_duty(temp + hysteresis_milli, config) >= last_duty:
+                    logging.debug(
+                        "Holding duty at %s%% (temp %s m°C within %s m°C hysteresis band).",
+                        last_duty,
+                        temp,
+                        hysteresis_milli,
+                    )
+                    duty = last_duty
+
             # Log temperature and calculated duty if verbose
-            if config.get("verbose"):
-                logging.info(
-                    _("Temperature: {temp:.1f}°C => Calculated duty cycle: {duty}%").format(temp=temp, duty=duty)
-                )
+            if verbose and root_logger.isEnabledFor(logging.INFO):
+                logging.info(_MSG_TEMP_DUTY, temp / 1000.0, duty)
 
             if duty != last_duty:
-                logging.info(
-                    _(
-                        "Temperature {temp:.1f}°C triggers change: Updating duty cycle from {old_duty}% to {new_duty}%."
-                    ).format(temp=temp, old_duty=last_duty, new_duty=duty)
-                )
-                set_duty_cycle(duty, period, pwm_path)  # Error handling is inside set_duty_cycle
-                # We might want to confirm the write was successful by reading back duty_cycle if critical
+                logging.info(_MSG_DUTY_CHANGE, temp / 1000.0, last_duty, duty)
+                # PWM drivers can be slow to apply writes, so also coalesce at
+                # the nanosecond granularity the driver actually sees: two
+                # percent values can round to the same duty_cycle ns.
+                target_ns = duty_ns_table.get(duty)
+                if target_ns is None:  # Duty outside the current curve levels
+                    target_ns = int(duty_scale * duty)
+                if target_ns == last_duty_ns:
+                    logging.debug("Duty %s%% maps to already-written %s ns; skipping sysfs write.", duty, target_ns)
+                else:
+                    # Error handling is inside set_duty_cycle
+                    set_duty_cycle(
+                        duty,
+                        period,
+                        pwm_path,
+                        duty_file=sysfs_files.get("duty"),
+                        enable_file=sysfs_files.get("enable"),
+                        chardev=sysfs_files.get("chardev"),
+                        duty_ns_bytes=duty_bytes_table.get(duty),
+                    )
+                    last_duty_ns = target_ns
                 last_duty = duty
             else:
-                logging.debug(f"Temperature {temp:.1f}°C, duty cycle {duty}% unchanged.")
+                logging.debug("Temperature %s m°C, duty cycle %s%% unchanged.", temp, duty)
 
         except Exception as e:
             # Catch unexpected errors in the main loop
             logging.exception(_("Unexpected error in auto mode main loop: {error}").format(error=e))
-            # Avoid busy-looping on continuous errors
-            time.sleep(interval * 2)  # Sleep longer after unexpected error
-
-        # --- Wait for next interval ---
-        logging.debug(f"Sleeping for {interval} seconds.")
-        time.sleep(interval)
+            # No extra sleep here: the trailing wait below already paces the
+            # loop, and sleeping in both places used to double the effective
+            # interval after any transient error.
+
+        # --- Wait until the next scheduled tick (woken early by signals or config changes) ---
+        # The deadline is advanced on the monotonic clock, so loop body time
+        # (sampling waits included) is absorbed instead of accumulating as
+        # drift: each cycle starts interval seconds after the previous one.
+        next_tick += interval
+        remaining = next_tick - time.monotonic()
+        if remaining <= 0:
+            # Overran the slot (slow sensors or an error path); realign on
+            # now instead of racing through zero-length waits to catch up.
+            next_tick = time.monotonic()
+            remaining = 0
+        logging.debug("Waiting up to %.3f seconds until the next tick.", remaining)
+        if remaining:
+            wait_for_events(remaining)
 
 
 def manual_mode(initial_config):
@@ -640,53 +1363,91 @@ def manual_mode(initial_config):
     # Use the validated config from main()
     config = initial_config
     pwm_path = config["pwm_path"]
-    period = -1
-    # Initialize PWM for manual mode
-    try:
-        if not check_pwm_enabled(pwm_path):
-            logging.error(_("PWM check failed. Manual mode cannot run."))
-            sys.exit(1)
-        period = read_period(pwm_path)
-        logging.info(_("PWM initialized for manual mode. Period: {period} ns").format(period=period))
-    except Exception:
-        # Error logged in called functions
-        logging.critical(_("Failed to initialize PWM for manual mode. Exiting.").format(path=pwm_path))
+    # Initialize PWM for manual mode with the combined probe
+    period = probe_pwm(pwm_path)
+    if period is None:
+        # Error logged by probe_pwm
+        logging.critical(_("Failed to initialize PWM for manual mode. Exiting."))
         sys.exit(1)
+    logging.info(_("PWM initialized for manual mode. Period: {period} ns").format(period=period))
+    chardev = PwmChardev.probe(pwm_path)
 
     # Input loop
-    while True:
-        try:
-            user_input = input(_("Set duty cycle (%) or 'quit' > "))
-            cmd = user_input.strip().lower()
-            if cmd == "quit":
-                logging.info(_("Exiting manual mode."))
+    try:
+        while True:
+            try:
+                user_input = input(_("Set duty cycle (%) or 'quit' > "))
+                cmd = user_input.strip().lower()
+                if cmd == "quit":
+                    logging.info(_("Exiting manual mode."))
+                    break
+                # Allow setting 0% duty cycle
+                percent = float(cmd)
+                # Validation happens inside set_duty_cycle (clamping)
+                set_duty_cycle(percent, period, pwm_path, chardev=chardev)
+                # Log the clamped value if possible, or just the requested value
+                logging.info(_("Manually setting duty cycle towards {percent}%.").format(percent=percent))
+
+            except ValueError:
+                print(_("Invalid input. Please enter a number (0-100) or 'quit'."))
+            except EOFError:  # Handle Ctrl+D
+                logging.info(_("EOF received, exiting manual mode."))
                 break
-            # Allow setting 0% duty cycle
-            percent = float(cmd)
-            # Validation happens inside set_duty_cycle (clamping)
-            set_duty_cycle(percent, period, pwm_path)
-            # Log the clamped value if possible, or just the requested value
-            logging.info(_("Manually setting duty cycle towards {percent}%.").format(percent=percent))
+            except KeyboardInterrupt:  # Handle Ctrl+C during input
+                logging.info(_("Keyboard interrupt during input, exiting manual mode."))
+                break
+            except Exception as e:
+                logging.exception(_("Error in manual mode input loop: {error}").format(error=e))
+    finally:
+        if chardev is not None:
+            chardev.close()
 
-        except ValueError:
-            print(_("Invalid input. Please enter a number (0-100) or 'quit'."))
-        except EOFError:  # Handle Ctrl+D
-            logging.info(_("EOF received, exiting manual mode."))
-            break
-        except KeyboardInterrupt:  # Handle Ctrl+C during input
-            logging.info(_("Keyboard interrupt during input, exiting manual mode."))
-            break
-        except Exception as e:
-            logging.exception(_("Error in manual mode input loop: {error}").format(error=e))
 
+def oneshot_mode(initial_config):
+    """Performs a single read-evaluate-write cycle and exits.
+
+    Intended to be driven by a systemd timer (see
+    pwmfan-controller-oneshot.timer) as an alternative to the resident
+    auto-mode loop: no interpreter stays in memory between ticks, at the
+    cost of paying startup once per cycle. Only worthwhile for intervals
+    well above the interpreter startup time.
+    """
+    config = initial_config
+    pwm_path = config["pwm_path"]
+
+    period = probe_pwm(pwm_path)
+    if period is None:
+        # Error logged by probe_pwm
+        logging.critical(_("Failed to initialize PWM for oneshot mode. Exiting."))
+        sys.exit(1)
+
+    temp = read_temperature(config["temp_sensor_paths"])
+    if temp is None:
+        logging.critical(_("Temperature read failed in oneshot mode. Exiting."))
+        sys.exit(1)
+
+    duty = temp_to_duty(temp, config)
+    if duty is None:
+        logging.critical(_("Failed to calculate duty cycle in oneshot mode. Exiting."))
+        sys.exit(1)
+
+    logging.info(_MSG_TEMP_DUTY, temp / 1000.0, duty)
+    set_duty_cycle(duty, period, pwm_path)
 
+
+@functools.lru_cache(maxsize=1)
 def detect_raspberry_pi_model():
-    """Detects the Raspberry Pi model by reading the device tree."""
+    """Detects the Raspberry Pi model by reading the device tree.
+
+    The model cannot change at runtime, so the device-tree read happens once
+    per process; config reloads and the RPi 5 firmware warning reuse the
+    cached string.
+    """
     try:
         model_str = read_sysfs_value(RASPBERRY_PI_MODEL_PATH)
         # The model string might contain null characters, strip them
         model_str_cleaned = model_str.replace("\x00", "").strip()
-        logging.debug(f"Detected Raspberry Pi model: {model_str_cleaned}")
+        logging.debug("Detected Raspberry Pi model: %s", model_str_cleaned)
         return model_str_cleaned
     except (FileNotFoundError, PermissionError, OSError):
         logging.warning(
@@ -703,25 +1464,57 @@ def detect_raspberry_pi_model():
 
 
 def main():
-    # Use _() for translatable strings in argparse descriptions and help text
-    parser = argparse.ArgumentParser(
-        description=_("PWM Fan Smart Controller (config: {config_file})").format(config_file=CONFIG_FILE),
-        prog=APP_NAME,  # Use APP_NAME for program name in help/version
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",  # Display program name and version
-        help=_("Show program's version number and exit"),
-    )
-    parser.add_argument("--mode", choices=["auto", "manual"], default="auto", help=_("Select mode: auto or manual"))
-    # Removed --interval argument
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help=_("Enable verbose logging output (overrides config log_level to INFO)"),  # Clarified help
+    # Fast path for --version: printing one line does not justify building a
+    # parser (argparse alone drags in re/textwrap/copy at import time).
+    if len(sys.argv) == 2 and sys.argv[1] == "--version":
+        print(f"{APP_NAME} {__version__}")
+        return
+
+    # The dominant launch is systemd starting the daemon with no arguments;
+    # skip argparse (and its translated help strings) entirely in that case
+    # and supply the parser's defaults directly.
+    if len(sys.argv) == 1:
+        args = types.SimpleNamespace(mode="auto", verbose=False)
+    else:
+        # Deferred so the daemon's import cost is paid only when real argument
+        # parsing is actually needed
+        import argparse
+
+        # Use _() for translatable strings in argparse descriptions and help text
+        parser = argparse.ArgumentParser(
+            description=_("PWM Fan Smart Controller (config: {config_file})").format(config_file=CONFIG_FILE),
+            prog=APP_NAME,  # Use APP_NAME for program name in help/version
+        )
+        parser.add_argument(
+            "--version",
+            action="version",
+            version=f"%(prog)s {__version__}",  # Display program name and version
+            help=_("Show program's version number and exit"),
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["auto", "manual", "oneshot"],
+            default="auto",
+            help=_("Select mode: auto (resident loop), manual, or oneshot (single cycle, for timer-driven use)"),
+        )
+        # Removed --interval argument
+        parser.add_argument(
+            "--verbose",
+            action="store_true",
+            help=_("Enable verbose logging output (overrides config log_level to INFO)"),  # Clarified help
+        )
+        args = parser.parse_args()
+
+    # --- Bootstrap Logging ---
+    # load_config() itself logs (parse warnings, hardware-detection fallbacks);
+    # without an explicit handler those records hit the root logger's bare
+    # default (WARNING to stderr, no format) and INFO messages are dropped.
+    # Configure a provisional level now and re-apply the config-derived one
+    # below with force=True.
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format=_LOG_FORMAT_VERBOSE if args.verbose else _LOG_FORMAT_NORMAL,
     )
-    args = parser.parse_args()
 
     # --- Initial Configuration Load & Validation ---
     # load_config() now incorporates hardware detection defaults
@@ -730,10 +1523,10 @@ def main():
     # --- Logging Setup ---
     # Allow command line verbose to override config OR default
     log_level_name = config.get("log_level", "WARNING").upper()  # Allow setting log level in config
-    try:
-        # Map name to level
-        level = logging.getLevelName(log_level_name)
-    except ValueError:
+    level = _LOG_LEVELS.get(log_level_name)
+    if level is None:
+        # The old getLevelName-based parse silently accepted any name here
+        # (its reverse lookup returns a string on a miss, never ValueError)
         logging.warning(
             _("Invalid log_level '{log_level_name}' in config. Using WARNING.").format(log_level_name=log_level_name)
         )
@@ -742,33 +1535,44 @@ def main():
     # Command line --verbose overrides to INFO
     if args.verbose:
         level = logging.INFO
-        log_format = "[%(levelname)s %(filename)s:%(lineno)d] %(message)s"  # More detail if verbose
+        log_format = _LOG_FORMAT_VERBOSE  # More detail if verbose
     else:
-        log_format = "[%(levelname)s] %(message)s"  # Simpler format for normal operation
+        log_format = _LOG_FORMAT_NORMAL  # Simpler format for normal operation
 
     logging.basicConfig(
         level=level,
         format=log_format,  # Use selected format
         force=True,  # Force re-configuration if basicConfig was called implicitly before
     )
-    logging.info(
-        _("Logging initialized. Effective level: {level_name}").format(
-            level_name=logging.getLevelName(logging.getLogger().getEffectiveLevel())
+    # Guarded: the getLevelName lookup and the .format both run before
+    # logging could discard the record, so skip them when INFO is off
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(
+            _("Logging initialized. Effective level: {level_name}").format(
+                level_name=logging.getLevelName(logging.getLogger().getEffectiveLevel())
+            )
         )
-    )
 
     # --- RPi Firmware Warning ---
     # Keep the existing warning based on thermal zones found in the *final* config
     try:
-        # Check based on the final loaded config's temp paths
-        final_temp_paths = config.get("temp_sensor_paths", [])
-        has_multiple_zones = (
-            len(final_temp_paths) > 1
-            or any("thermal_zone1" in p for p in final_temp_paths)
-            or os.path.exists("/sys/class/thermal/thermal_zone1")
-        )
+        # Cheapest predicate first: the model string is cached, so non-Pi-5
+        # systems skip the path scan and the thermal_zone1 stat entirely.
+        # Within the zone check, `or` short-circuits left to right, so the
+        # stat() only runs when the config itself doesn't prove multiple
+        # zones.
+        if "Raspberry Pi 5" in (detect_raspberry_pi_model() or ""):
+            # Check based on the final loaded config's temp paths
+            final_temp_paths = config.get("temp_sensor_paths", [])
+            has_multiple_zones = (
+                len(final_temp_paths) > 1
+                or any("thermal_zone1" in p for p in final_temp_paths)
+                or os.path.exists("/sys/class/thermal/thermal_zone1")
+            )
+        else:
+            has_multiple_zones = False
 
-        if has_multiple_zones and "Raspberry Pi 5" in (detect_raspberry_pi_model() or ""):
+        if has_multiple_zones:
             # Show warning only if multiple zones detected AND it looks like an RPi 5
             logging.warning("-----------------------------------------------------")
             logging.warning(_("Multiple thermal zones detected (potentially Raspberry Pi 5 or similar)."))
@@ -778,26 +1582,17 @@ def main():
             logging.warning(_("This script might conflict or have no effect in that case."))
             logging.warning("-----------------------------------------------------")
     except Exception as e:
-        logging.debug(f"Could not perform RPi 5 check: {e}")
+        logging.debug("Could not perform RPi 5 check: %s", e)
 
     # --- Signal Handling ---
-    def signal_handler(sig, frame):
-        logging.info(
-            _("Received signal {signal_name} ({signal_number}), terminating program.").format(
-                signal_name=signal.Signals(sig).name, signal_number=sig
-            )
-        )
-        # Optionally try to set a safe fan speed before exiting
-        # try:
-        #     period = read_period(config["pwm_path"])
-        #     set_duty_cycle(100, period, config["pwm_path"])
-        #     logging.info(_("Set fan to 100% before exiting."))
-        # except Exception as e:
-        #     logging.warning(_("Could not set fan speed on exit: {error}").format(error=e))
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    if args.mode == "auto":
+        # auto_mode waits in select() with a wakeup pipe, so a minimal
+        # flag-setting handler gives prompt, controlled shutdown.
+        signal.signal(signal.SIGINT, _request_shutdown)
+        signal.signal(signal.SIGTERM, _request_shutdown)
+    else:
+        signal.signal(signal.SIGINT, _exit_on_signal)
+        signal.signal(signal.SIGTERM, _exit_on_signal)
     logging.debug("Signal handlers registered for SIGINT and SIGTERM.")
 
     # --- Mode Dispatch ---
@@ -805,6 +1600,8 @@ def main():
         auto_mode(config)  # Pass the final validated config
     elif args.mode == "manual":
         manual_mode(config)  # Pass the final validated config
+    elif args.mode == "oneshot":
+        oneshot_mode(config)  # Single cycle, then exit
     else:
         logging.error(_("Invalid mode selected: {mode}").format(mode=args.mode))
         sys.exit(1)
@@ -816,12 +1613,12 @@ if __name__ == "__main__":
     # --- Global Exception Handling ---
     try:
         main()
-    except SystemExit as e:
-        # Catch sys.exit() to allow clean exit logging if needed
-        logging.info(_("Exiting with code {code}").format(code=e.code))
-        sys.exit(e.code)  # Re-exit with the original code
+    except SystemExit:
+        # Every normal exit path (including the signal handlers' sys.exit)
+        # lands here; re-raise without logging so clean shutdown stays cheap.
+        # "Program finished." from main() already covers the happy path.
+        raise
     except KeyboardInterrupt:
-        logging.info(_("Keyboard interrupt detected during initialization/shutdown."))
         sys.exit(130)  # Standard exit code for Ctrl+C
     except Exception:
         # Catch-all for unexpected errors during startup/main execution